@@ -4,19 +4,279 @@ HVAC Newsletter Generator
 Automated system to curate, process, and send HVAC industry newsletters
 """
 
+import asyncio
+import concurrent.futures
+import aiohttp
 import feedparser
-import requests
 import json
 import hashlib
+import html
+import heapq
+import itertools
 import os
 import re
+import xml.etree.ElementTree as ElementTree
+from io import BytesIO
 from datetime import datetime, timedelta
 from urllib.parse import urljoin
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Set
-import time
+from operator import attrgetter
+from typing import List, Dict, Optional, Set, Tuple
 
-@dataclass
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_SCRIPT_STYLE_RE = re.compile(r'<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Common RSS feed artifacts stripped from summaries
+_ARTIFACT_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'The post .+ appeared first on .+',
+    r'Continue reading .+',
+    r'Read more .+',
+    r'\[…\]',
+    r'\.\.\..*$',  # Remove trailing ellipsis and everything after
+    r'–\s*$',     # Remove trailing dashes
+    r'More\s*$',  # Remove trailing "More"
+))
+
+# Sentences that are likely navigation/boilerplate
+_BOILERPLATE_PHRASES = (
+    'appeared first on',
+    'continue reading',
+    'read more',
+    'the post',
+    'click here',
+    'visit our',
+    'subscribe to',
+)
+
+# Category keywords, checked in order
+_CATEGORIES = (
+    ('Technology', frozenset({'smart', 'iot', 'digital', 'automation', 'ai', 'tech'})),
+    ('Refrigeration', frozenset({'refrigeration', 'cooling', 'chiller', 'freezer'})),
+    ('Heat Pumps', frozenset({'heat pump', 'geothermal', 'air source'})),
+    ('Commercial', frozenset({'commercial', 'industrial', 'facility'})),
+    ('Residential', frozenset({'residential', 'home', 'homeowner'})),
+    ('Efficiency', frozenset({'efficiency', 'energy', 'savings', 'green'})),
+    ('Regulations', frozenset({'regulation', 'code', 'standard', 'compliance'})),
+    ('Business', frozenset({'business', 'market', 'sales', 'revenue', 'growth'})),
+)
+
+# High-value ranking keywords
+_HIGH_VALUE_KEYWORDS = frozenset({
+    'hvac', 'air conditioning', 'heating', 'ventilation',
+    'energy efficiency', 'smart thermostat', 'heat pump',
+    'refrigeration', 'indoor air quality', 'commercial'
+})
+
+# Word forms that count as a keyword but are more than its simple plural
+_KEYWORD_VARIANTS = {
+    'hvacr': 'hvac',
+    'technology': 'tech',
+    'technologies': 'tech',
+    'smarter': 'smart',
+}
+
+# Sent with every request; aiohttp transparently decompresses responses
+_REQUEST_HEADERS = {
+    'Accept-Encoding': 'gzip, deflate',
+    'User-Agent': 'HVACNewsletter/1.0',
+}
+
+# Only the most recent entries of each feed are considered
+_MAX_ENTRIES_PER_FEED = 10
+
+# Feed namespaces whose elements carry an entry's core fields: plain RSS 2.0,
+# Atom, RSS 1.0 and RSS 0.90; extension elements like media:title are ignored
+_ATOM_NS = 'http://www.w3.org/2005/Atom'
+_CORE_NAMESPACES = frozenset({
+    '',
+    _ATOM_NS,
+    'http://purl.org/rss/1.0/',
+    'http://my.netscape.com/rdf/simple/0.9/',
+})
+_CONTENT_NS = 'http://purl.org/rss/1.0/modules/content/'
+_ITUNES_NS = 'http://www.itunes.com/dtds/podcast-1.0.dtd'
+
+# RSS <item> / Atom <entry> child elements mapped to feedparser's entry keys
+_ENTRY_TAGS = frozenset({'item', 'entry'})
+_ENTRY_FIELDS = {
+    'title': 'title',
+    'description': 'summary',
+    'summary': 'summary',
+    'pubDate': 'published',
+    'published': 'published',
+}
+
+# Full-body elements used as the summary when an entry has no description,
+# in order of preference, as feedparser does
+_SUMMARY_FALLBACKS = (
+    (_CONTENT_NS, 'encoded'),
+    (_ATOM_NS, 'content'),
+    (_ITUNES_NS, 'summary'),
+)
+
+# Articles included in each newsletter
+_MAX_NEWSLETTER_ARTICLES = 20
+
+# How long processed article hashes are remembered
+_PROCESSED_RETENTION_DAYS = 30
+
+# Hex length of the SHA-256 content hashes stored before the switch to BLAKE2b
+_LEGACY_HASH_LENGTH = 64
+
+# Static markup of each newsletter article block, interleaved with its escaped
+# url, title, source, summary and url again
+_ARTICLE_HTML_PARTS = (
+    '''
+                <div style="margin-bottom: 20px; padding: 15px; border-left: 3px solid #007acc;">
+                    <h3><a href="''',
+    '''" style="color: #007acc; text-decoration: none;">
+                        ''',
+    '''
+                    </a></h3>
+                    <p style="color: #666; margin: 5px 0;">
+                        <strong>Source:</strong> ''',
+    '''
+                    </p>
+                    <p style="line-height: 1.6;">
+                        ''',
+    '''
+                    </p>
+                    <p>
+                        <a href="''',
+    '''" style="color: #007acc;">Read full article →</a>
+                    </p>
+                </div>
+                ''',
+)
+
+# Bonus for certain sources (adjust as needed)
+_SOURCE_BONUS = {
+    'ACHR News': 0.2,
+    'Contracting Business': 0.1,
+}
+
+
+def _keyword_pattern(keywords) -> str:
+    """Whole-word alternation over keywords, allowing a simple plural"""
+    return r'\b(%s)s?\b' % '|'.join(re.escape(keyword) for keyword in keywords)
+
+
+def _build_keyword_scanner():
+    """Compile every keyword into one regex and map each to the keywords it contains"""
+    keywords = set(_HIGH_VALUE_KEYWORDS)
+    for _, category_keywords in _CATEGORIES:
+        keywords |= category_keywords
+
+    # Longest first, so 'energy efficiency' wins over 'energy' at the same position;
+    # the shorter keywords it contains are still credited through the mapping
+    pattern = re.compile(_keyword_pattern(sorted(keywords | _KEYWORD_VARIANTS.keys(), key=len, reverse=True)))
+    contains = {
+        keyword: frozenset(other for other in keywords if re.search(_keyword_pattern([other]), keyword))
+        for keyword in keywords
+    }
+    for variant, keyword in _KEYWORD_VARIANTS.items():
+        contains[variant] = contains[keyword]
+    return pattern, contains
+
+
+_KEYWORD_RE, _KEYWORD_CONTAINS = _build_keyword_scanner()
+
+
+def _scan_keywords(content: str) -> Set[str]:
+    """Find all keywords in lowercased text with a single pass over it"""
+    hits = set()
+    for match in _KEYWORD_RE.finditer(content):
+        hits |= _KEYWORD_CONTAINS[match.group(1)]
+    return hits
+
+
+def _strip_html(markup: str) -> str:
+    """Remove tags, scripts and styles from an HTML fragment and decode entities"""
+    return html.unescape(_HTML_TAG_RE.sub('', _SCRIPT_STYLE_RE.sub('', markup)))
+
+
+def _plain_text(markup: str) -> str:
+    """Visible text of an HTML fragment with normalized whitespace"""
+    return ' '.join(_strip_html(markup).split())
+
+
+def _split_tag(tag: str):
+    """Split an ElementTree tag into its namespace and local name"""
+    if tag.startswith('{'):
+        namespace, _, name = tag[1:].partition('}')
+        return namespace, name
+    return '', tag
+
+
+def _element_text(element) -> str:
+    """Text of an element, including any inline markup children (Atom type="xhtml")"""
+    return ''.join(element.itertext())
+
+
+def _entry_from_element(element) -> Dict[str, str]:
+    """Map an RSS item or Atom entry element to a feedparser-style entry dict"""
+    entry = {}
+    fallbacks = {}
+    permalink = None
+    for child in element:
+        namespace, name = _split_tag(child.tag)
+        if namespace not in _CORE_NAMESPACES:
+            if (namespace, name) in _SUMMARY_FALLBACKS:
+                fallbacks.setdefault((namespace, name), _element_text(child))
+            continue
+        if name == 'link':
+            # Atom carries the URL in href; prefer the alternate link
+            href = child.get('href')
+            if href is None:
+                entry.setdefault('link', (child.text or '').strip())
+            elif child.get('rel', 'alternate') == 'alternate':
+                entry.setdefault('link', href)
+        elif name == 'content':
+            fallbacks.setdefault((_ATOM_NS, name), _element_text(child))
+        elif name == 'guid':
+            # An RSS guid is the item's permalink unless marked otherwise
+            if permalink is None and child.get('isPermaLink', 'true') != 'false':
+                permalink = (child.text or '').strip()
+        elif name in _ENTRY_FIELDS:
+            entry.setdefault(_ENTRY_FIELDS[name], _element_text(child))
+    
+    if 'link' not in entry and permalink:
+        entry['link'] = permalink
+    if 'summary' not in entry:
+        for key in _SUMMARY_FALLBACKS:
+            if key in fallbacks:
+                entry['summary'] = fallbacks[key]
+                break
+    return entry
+
+
+def _feedparser_entries(body: bytes, limit: int = _MAX_ENTRIES_PER_FEED) -> List[Dict[str, str]]:
+    """Parse the first entries of a feed with feedparser"""
+    return feedparser.parse(body).entries[:limit]
+
+
+def _parse_feed_entries(body: bytes, limit: int = _MAX_ENTRIES_PER_FEED) -> List[Dict[str, str]]:
+    """Parse the first entries of a feed, stopping once limit is reached
+
+    Feeds that are not well-formed XML fall back to feedparser.
+    """
+    entries = []
+    try:
+        for _, element in ElementTree.iterparse(BytesIO(body), events=('end',)):
+            namespace, name = _split_tag(element.tag)
+            if namespace not in _CORE_NAMESPACES or name not in _ENTRY_TAGS:
+                continue
+            entries.append(_entry_from_element(element))
+            element.clear()
+            if len(entries) >= limit:
+                break
+    except ElementTree.ParseError:
+        return _feedparser_entries(body, limit)
+    return entries
+
+
+@dataclass(slots=True)
 class Article:
     title: str
     url: str
@@ -25,6 +285,7 @@ class Article:
     published: str
     content_hash: str
     category: str = "General"
+    score: float = 0.0
 
 class HVACNewsletterGenerator:
     def __init__(self):
@@ -48,128 +309,169 @@ class HVACNewsletterGenerator:
             'Consulting Specifying Engineer': 'https://www.csemag.com/feed/',
         }
         
+        # Worker threads for feed parsing so it overlaps with downloads
+        self._parse_pool = concurrent.futures.ThreadPoolExecutor(max_workers=min(4, len(self.rss_feeds)))
+        
         # File paths
         self.processed_file = 'data/processed_articles.json'
         self.template_file = 'data/newsletter_template.html'
+        self.feed_state_file = 'data/feed_state.json'
         
         # Load processed articles
         self.processed_articles = self.load_processed_articles()
+        
+        # Hashes of every entry currently listed in a feed; their retention window
+        # restarts on save, so only articles that have left every feed expire
+        self.current_hashes = set()
+        
+        # Hashes from before the switch to BLAKE2b are still checked until they expire
+        self.has_legacy_hashes = any(len(content_hash) == _LEGACY_HASH_LENGTH for content_hash in self.processed_articles)
+        
+        # Load HTTP validators (ETag / Last-Modified) from previous fetches
+        self.feed_state = self.load_feed_state()
 
-    def load_processed_articles(self) -> Set[str]:
-        """Load previously processed article hashes"""
+    def load_processed_articles(self) -> Dict[str, int]:
+        """Load previously processed article hashes, mapped to when they were processed"""
         try:
             with open(self.processed_file, 'r') as f:
                 data = json.load(f)
-                return set(data.get('processed_hashes', []))
         except (FileNotFoundError, json.JSONDecodeError):
-            return set()
+            return {}
+        
+        processed = {content_hash: int(timestamp) for content_hash, timestamp in data.get('entries', [])}
+        
+        # Older files stored bare hashes; start their retention window now
+        now = int(datetime.now().timestamp())
+        for content_hash in data.get('processed_hashes', []):
+            processed.setdefault(content_hash, now)
+        
+        return processed
 
     def save_processed_articles(self, new_hashes: Set[str]):
         """Save processed article hashes"""
         os.makedirs(os.path.dirname(self.processed_file), exist_ok=True)
         
-        # Combine with existing and keep only last 30 days worth
-        all_hashes = self.processed_articles.union(new_hashes)
+        # Combine with existing and keep only last 30 days worth, counted from
+        # the last run that still saw the article in a feed
+        now = datetime.now()
+        timestamp_now = int(now.timestamp())
+        cutoff = int((now - timedelta(days=_PROCESSED_RETENTION_DAYS)).timestamp())
+        entries = {}
+        for content_hash, timestamp in self.processed_articles.items():
+            if content_hash in self.current_hashes:
+                timestamp = timestamp_now
+            if timestamp >= cutoff:
+                entries[content_hash] = timestamp
+        entries.update(dict.fromkeys(new_hashes, timestamp_now))
         
         data = {
-            'processed_hashes': list(all_hashes),
-            'last_updated': datetime.now().isoformat()
+            'entries': [[content_hash, timestamp] for content_hash, timestamp in entries.items()],
+            'last_updated': now.isoformat()
         }
         
         with open(self.processed_file, 'w') as f:
-            json.dump(data, f, indent=2)
+            json.dump(data, f, separators=(',', ':'))
+
+    def load_feed_state(self) -> Dict[str, Dict]:
+        """Load per-feed HTTP caching state"""
+        try:
+            with open(self.feed_state_file, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save_feed_state(self):
+        """Save per-feed HTTP caching state"""
+        os.makedirs(os.path.dirname(self.feed_state_file), exist_ok=True)
+        
+        with open(self.feed_state_file, 'w') as f:
+            json.dump(self.feed_state, f, indent=2, sort_keys=True)
 
     def generate_content_hash(self, title: str, content: str) -> str:
-        """Generate SHA-256 hash of article content for deduplication"""
+        """Generate BLAKE2b-128 hash of article content for deduplication"""
+        content_hash = hashlib.blake2b(digest_size=16)
+        content_hash.update(title.lower().strip().encode())
+        content_hash.update(content.lower().strip().encode())
+        return content_hash.hexdigest()
+
+    def generate_legacy_content_hash(self, title: str, content: str) -> str:
+        """Generate the SHA-256 hash used for deduplication before BLAKE2b"""
         combined = f"{title.lower().strip()}{content.lower().strip()}"
         return hashlib.sha256(combined.encode()).hexdigest()
 
-    def fetch_articles_from_feed(self, feed_url: str, source_name: str) -> List[Article]:
-        """Fetch and parse articles from RSS feed"""
+    def extract_articles(self, entries: List[Dict[str, str]], source_name: str, seen: Set[str],
+                         feed_hashes: Set[str]) -> List[Article]:
+        """Extract articles from parsed feed entries, skipping any whose hash is already in seen
+
+        The hash of every entry, new or not, is added to feed_hashes.
+        """
         articles = []
         
-        try:
-            feed = feedparser.parse(feed_url)
+        for entry in entries:
+            # Clean and extract content
+            title = entry.get('title', '').strip()
+            url = entry.get('link', '')
+            summary = entry.get('summary', entry.get('description', ''))
+            published = entry.get('published', '')
             
-            for entry in feed.entries[:10]:  # Limit to recent articles
-                # Clean and extract content
-                title = entry.get('title', '').strip()
-                url = entry.get('link', '')
-                summary = entry.get('summary', entry.get('description', ''))
-                published = entry.get('published', '')
-                
-                if not title or not url:
-                    continue
-                
-                # Generate content hash for deduplication
-                content_hash = self.generate_content_hash(title, summary)
-                
-                # Skip if already processed
-                if content_hash in self.processed_articles:
-                    continue
-                
-                # Categorize article
-                category = self.categorize_article(title, summary)
-                
-                # Create article object
-                article = Article(
-                    title=title,
-                    url=url,
-                    summary=self.clean_summary(summary),
-                    source=source_name,
-                    published=published,
-                    content_hash=content_hash,
-                    category=category
-                )
-                
-                articles.append(article)
-                
-        except Exception as e:
-            print(f"Error fetching from {source_name}: {e}")
-        
+            if not title or not url:
+                continue
+            
+            # Generate content hash for deduplication; hashing the visible text keeps
+            # it stable whether the entry came from ElementTree or feedparser
+            content_hash = self.generate_content_hash(title, _plain_text(summary))
+            
+            # Articles recorded under their old SHA-256 hash are remembered under the new one
+            if self.has_legacy_hashes and content_hash not in self.processed_articles:
+                legacy_hash = self.generate_legacy_content_hash(title, summary)
+                if legacy_hash in self.processed_articles:
+                    self.processed_articles[content_hash] = self.processed_articles[legacy_hash]
+            
+            feed_hashes.add(content_hash)
+            
+            # Skip if already processed or fetched from another feed this run
+            if content_hash in self.processed_articles or content_hash in seen:
+                continue
+            seen.add(content_hash)
+            
+            # Categorize and score article in a single pass over its text
+            summary = self.clean_summary(summary)
+            category, score = self._classify_and_score(f"{title} {summary}".lower(), source_name)
+            
+            # Create article object
+            article = Article(
+                title=title,
+                url=url,
+                summary=summary,
+                source=source_name,
+                published=published,
+                content_hash=content_hash,
+                category=category,
+                score=score
+            )
+            
+            articles.append(article)
+
         return articles
 
-    def categorize_article(self, title: str, summary: str) -> str:
-        """Simple categorization based on keywords"""
-        content = f"{title} {summary}".lower()
-        
-        categories = {
-            'Technology': ['smart', 'iot', 'digital', 'automation', 'ai', 'tech'],
-            'Refrigeration': ['refrigeration', 'cooling', 'chiller', 'freezer'],
-            'Heat Pumps': ['heat pump', 'geothermal', 'air source'],
-            'Commercial': ['commercial', 'industrial', 'facility'],
-            'Residential': ['residential', 'home', 'homeowner'],
-            'Efficiency': ['efficiency', 'energy', 'savings', 'green'],
-            'Regulations': ['regulation', 'code', 'standard', 'compliance'],
-            'Business': ['business', 'market', 'sales', 'revenue', 'growth']
-        }
+    def _classify_and_score(self, lower_text: str, source_name: str) -> Tuple[str, float]:
+        """Categorize and rank an article based on keywords"""
+        hits = _scan_keywords(lower_text)
         
-        for category, keywords in categories.items():
-            if any(keyword in content for keyword in keywords):
-                return category
+        category = next((name for name, keywords in _CATEGORIES if keywords & hits), 'General')
+        score = len(_HIGH_VALUE_KEYWORDS & hits) + _SOURCE_BONUS.get(source_name, 0)
         
-        return 'General'
+        return category, score
 
     def clean_summary(self, summary: str) -> str:
         """Clean and intelligently extract article summary"""
-        import re
-    
-        # Remove HTML tags
-        clean_text = re.sub(r'<[^>]+>', '', summary)
+        # Remove HTML tags, scripts and styles and decode entities; the text is
+        # escaped again when rendered
+        clean_text = _strip_html(summary)
     
         # Remove common RSS feed artifacts
-        artifacts_to_remove = [
-            r'The post .+ appeared first on .+',
-            r'Continue reading .+',
-            r'Read more .+',
-            r'\[…\]',
-            r'\.\.\..*$',  # Remove trailing ellipsis and everything after
-            r'–\s*$',     # Remove trailing dashes
-            r'More\s*$',  # Remove trailing "More"
-        ]
-    
-        for pattern in artifacts_to_remove:
-            clean_text = re.sub(pattern, '', clean_text, flags=re.IGNORECASE)
+        for pattern in _ARTIFACT_RES:
+            clean_text = pattern.sub('', clean_text)
     
         # Remove extra whitespace and normalize
         clean_text = ' '.join(clean_text.split()).strip()
@@ -179,7 +481,7 @@ class HVACNewsletterGenerator:
             return clean_text
     
         # Split into sentences
-        sentences = re.split(r'(?<=[.!?])\s+', clean_text)
+        sentences = _SENTENCE_SPLIT_RE.split(clean_text)
     
         # Build summary by adding complete sentences
         summary_parts = []
@@ -191,15 +493,8 @@ class HVACNewsletterGenerator:
                 continue
             
             # Skip sentences that are likely navigation/boilerplate
-            if any(skip_phrase in sentence.lower() for skip_phrase in [
-                'appeared first on',
-                'continue reading',
-                'read more',
-                'the post',
-                'click here',
-                'visit our',
-                'subscribe to'
-            ]):
+            sentence_lower = sentence.lower()
+            if any(skip_phrase in sentence_lower for skip_phrase in _BOILERPLATE_PHRASES):
                continue
         
             # Check if adding this sentence would make it too long
@@ -237,71 +532,93 @@ class HVACNewsletterGenerator:
     
         return result.strip() if result.strip() else "Industry news update available."
 
-    def fetch_all_articles(self) -> List[Article]:
-        """Fetch articles from all RSS feeds"""
-        all_articles = []
+    async def _fetch_one(self, session: aiohttp.ClientSession, source_name: str,
+                         feed_url: str) -> Optional[List[Dict[str, str]]]:
+        """Download and parse a single RSS feed
         
-        for source_name, feed_url in self.rss_feeds.items():
-            print(f"Fetching from {source_name}...")
-            articles = self.fetch_articles_from_feed(feed_url, source_name)
-            all_articles.extend(articles)
-            time.sleep(1)  # Be respectful to RSS feeds
-        
-        return all_articles
-
-    def deduplicate_articles(self, articles: List[Article]) -> List[Article]:
-        """Remove duplicate articles based on content similarity"""
-        seen_hashes = set()
-        unique_articles = []
-        
-        for article in articles:
-            if article.content_hash not in seen_hashes:
-                seen_hashes.add(article.content_hash)
-                unique_articles.append(article)
-        
-        return unique_articles
+        Returns None when the feed was skipped as unchanged or could not be fetched.
+        """
+        print(f"Fetching from {source_name}...")
+        
+        # Conditional GET: unchanged feeds answer 304 with no body
+        state = self.feed_state.get(feed_url, {})
+        headers = {}
+        if state.get('etag'):
+            headers['If-None-Match'] = state['etag']
+        if state.get('modified'):
+            headers['If-Modified-Since'] = state['modified']
 
-    def rank_articles(self, articles: List[Article]) -> List[Article]:
-        """Simple ranking based on keywords and recency"""
-        
-        def score_article(article: Article) -> float:
-            score = 0.0
-            content = f"{article.title} {article.summary}".lower()
-            
-            # High-value keywords
-            high_value_keywords = [
-                'hvac', 'air conditioning', 'heating', 'ventilation',
-                'energy efficiency', 'smart thermostat', 'heat pump',
-                'refrigeration', 'indoor air quality', 'commercial'
-            ]
+        try:
+            async with session.get(feed_url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as response:
+                if response.status == 304:
+                    print(f"{source_name} not modified since last run")
+                    self.current_hashes.update(state.get('entry_hashes', []))
+                    return None
+                response.raise_for_status()
+                body = await response.read()
+                validators = {
+                    'etag': response.headers.get('ETag'),
+                    'modified': response.headers.get('Last-Modified'),
+                }
             
-            for keyword in high_value_keywords:
-                if keyword in content:
-                    score += 1.0
+            new_state = {key: value for key, value in validators.items() if value}
+            new_state['body_hash'] = hashlib.blake2b(body, digest_size=16).hexdigest()
             
-            # Bonus for certain sources (adjust as needed)
-            source_bonus = {
-                'ACHR News': 0.2,
-                'Contracting Business': 0.1,
-            }
-            score += source_bonus.get(article.source, 0)
+            # Servers without conditional GET support resend identical bodies
+            if new_state['body_hash'] == state.get('body_hash'):
+                print(f"{source_name} unchanged since last run")
+                new_state['entry_hashes'] = state.get('entry_hashes', [])
+                self.current_hashes.update(new_state['entry_hashes'])
+                self.feed_state[feed_url] = new_state
+                return None
+
+            # Legacy hashes were taken over feedparser's sanitized summaries, so keep
+            # parsing with feedparser while any of them can still match
+            parse = _feedparser_entries if self.has_legacy_hashes else _parse_feed_entries
+            loop = asyncio.get_running_loop()
+            entries = await loop.run_in_executor(self._parse_pool, parse, body)
+            self.feed_state[feed_url] = new_state
+            return entries
+
+        except Exception as e:
+            print(f"Error fetching from {source_name}: {e}")
+            return None
+
+    async def fetch_all_articles_async(self, session: aiohttp.ClientSession) -> List[Article]:
+        """Fetch unique articles from all RSS feeds concurrently"""
+        results = await asyncio.gather(*[
+            self._fetch_one(session, source_name, feed_url)
+            for source_name, feed_url in self.rss_feeds.items()
+        ])
+        
+        # Extract in feed order so an article listed by several feeds is credited
+        # to the first of them, however the downloads finished
+        all_articles = []
+        seen = set()
+        for (source_name, feed_url), entries in zip(self.rss_feeds.items(), results):
+            if entries is None:
+                continue
+            feed_hashes = set()
+            all_articles.extend(self.extract_articles(entries, source_name, seen, feed_hashes))
             
-            return score
+            # Remembered so the entries' retention can be refreshed when the feed is
+            # skipped as unchanged on a later run
+            self.feed_state[feed_url]['entry_hashes'] = sorted(feed_hashes)
+            self.current_hashes |= feed_hashes
         
-        return sorted(articles, key=score_article, reverse=True)
+        return all_articles
+
+    def rank_articles(self, articles: List[Article]) -> List[Article]:
+        """Select the top-scoring articles, best first"""
+        return heapq.nlargest(_MAX_NEWSLETTER_ARTICLES, articles, key=attrgetter('score'))
 
     def generate_newsletter_html(self, articles: List[Article]) -> str:
         """Generate HTML newsletter content"""
     
-        # Group articles by category
-        categorized = {}
-        for article in articles[:20]:  # Limit to top 20
-            category = article.category
-            if category not in categorized:
-                categorized[category] = []
-            categorized[category].append(article)
+        # Sort by category, best first within each, so sections can be grouped in one pass
+        articles_sorted = sorted(articles[:_MAX_NEWSLETTER_ARTICLES], key=lambda a: (a.category, -a.score))
     
-        html_content = f"""
+        parts = [f"""
         <div style="max-width: 600px; margin: 0 auto; font-family: Arial, sans-serif;">
             <div style="background-color: #007acc; color: white; padding: 20px; text-align: center;">
                 <h1 style="margin: 0; font-size: 24px;">HVAC Brief</h1>
@@ -309,40 +626,33 @@ class HVACNewsletterGenerator:
             </div>
             <div style="padding: 20px; background-color: #ffffff;">
                 <p style="color: #666; margin-bottom: 30px;">Your curated selection of the latest HVAC industry news and insights.</p>
-        """
+        """]
         
-        for category, cat_articles in categorized.items():
-            html_content += f"<h2>{category}</h2>\n"
+        for category, cat_articles in itertools.groupby(articles_sorted, key=attrgetter('category')):
+            parts.append(f"<h2>{category}</h2>\n")
             
             for article in cat_articles:
-                html_content += f"""
-                <div style="margin-bottom: 20px; padding: 15px; border-left: 3px solid #007acc;">
-                    <h3><a href="{article.url}" style="color: #007acc; text-decoration: none;">
-                        {article.title}
-                    </a></h3>
-                    <p style="color: #666; margin: 5px 0;">
-                        <strong>Source:</strong> {article.source}
-                    </p>
-                    <p style="line-height: 1.6;">
-                        {article.summary}
-                    </p>
-                    <p>
-                        <a href="{article.url}" style="color: #007acc;">Read full article →</a>
-                    </p>
-                </div>
-                """
-        
-        html_content += f"""
+                url = html.escape(article.url)
+                parts.extend((
+                    _ARTICLE_HTML_PARTS[0], url,
+                    _ARTICLE_HTML_PARTS[1], html.escape(article.title),
+                    _ARTICLE_HTML_PARTS[2], html.escape(article.source),
+                    _ARTICLE_HTML_PARTS[3], html.escape(article.summary),
+                    _ARTICLE_HTML_PARTS[4], url,
+                    _ARTICLE_HTML_PARTS[5],
+                ))
+        
+        parts.append(f"""
         <hr style="margin: 30px 0;">
         <p style="color: #666; font-size: 12px;">
             This newsletter was automatically curated from industry sources. 
             Generated on {datetime.now().strftime('%Y-%m-%d at %H:%M UTC')}.
         </p>
-        """
+        """)
         
-        return html_content
+        return ''.join(parts)
 
-    def send_to_mailchimp(self, subject: str, content: str) -> bool:
+    async def send_to_mailchimp(self, session: aiohttp.ClientSession, subject: str, content: str) -> bool:
         """Send newsletter to Mailchimp"""
         if not self.mailchimp_api_key or not self.mailchimp_audience_id:
             print("Mailchimp API credentials not configured")
@@ -371,11 +681,11 @@ class HVACNewsletterGenerator:
         
         try:
             # Create campaign
-            response = requests.post(url, headers=headers, json=campaign_payload)
-            print(f"Campaign creation status: {response.status_code}")
-            response.raise_for_status()
+            async with session.post(url, headers=headers, json=campaign_payload) as response:
+                print(f"Campaign creation status: {response.status}")
+                await self._check_response(response)
+                campaign_data = await response.json()
             
-            campaign_data = response.json()
             campaign_id = campaign_data['id']
             
             # Add content to campaign
@@ -384,59 +694,76 @@ class HVACNewsletterGenerator:
                 'html': content
             }
             
-            content_response = requests.put(content_url, headers=headers, json=content_payload)
-            content_response.raise_for_status()
+            async with session.put(content_url, headers=headers, json=content_payload) as content_response:
+                await self._check_response(content_response)
             
             # Send campaign
             send_url = f"https://{self.mailchimp_server}.api.mailchimp.com/3.0/campaigns/{campaign_id}/actions/send"
-            send_response = requests.post(send_url, headers=headers)
-            send_response.raise_for_status()
+            async with session.post(send_url, headers=headers) as send_response:
+                await self._check_response(send_response)
             
             print("Newsletter sent successfully via Mailchimp!")
             return True
             
-        except requests.exceptions.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, KeyError) as e:
+            # ValueError covers a non-JSON body, KeyError a response without a campaign id
             print(f"Error sending to Mailchimp: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"Response content: {e.response.text}")
             return False
+
+    async def _check_response(self, response: aiohttp.ClientResponse):
+        """Raise for HTTP error statuses, printing the response body first"""
+        if response.status >= 400:
+            print(f"Response content: {await response.text()}")
+        response.raise_for_status()
+
     def run(self):
         """Main execution pipeline"""
-        print("Starting HVAC Newsletter Generation...")
-        
-        # 1. Fetch articles
-        print("Fetching articles from RSS feeds...")
-        articles = self.fetch_all_articles()
-        print(f"Fetched {len(articles)} new articles")
-        
-        if not articles:
-            print("No new articles found. Exiting.")
-            return
-        
-        # 2. Deduplicate
-        print("Removing duplicates...")
-        unique_articles = self.deduplicate_articles(articles)
-        print(f"After deduplication: {len(unique_articles)} unique articles")
-        
-        # 3. Rank and select top articles
-        print("Ranking articles...")
-        ranked_articles = self.rank_articles(unique_articles)
-        
-        # 4. Generate newsletter
-        print("Generating newsletter content...")
-        newsletter_html = self.generate_newsletter_html(ranked_articles)
-        
-        # 5. Send to Beehiiv
-        subject = f"HVAC Daily Brief - {datetime.now().strftime('%B %d, %Y')}"
-        success = self.send_to_mailchimp(subject, newsletter_html)
-        
-        if success:
-            # 6. Save processed article hashes
-            new_hashes = {article.content_hash for article in unique_articles}
-            self.save_processed_articles(new_hashes)
-            print("Newsletter generation completed successfully!")
-        else:
-            print("Newsletter generation failed.")
+        asyncio.run(self.run_async())
+
+    async def run_async(self):
+        """Pipeline over one HTTP session shared by feed fetches and Mailchimp"""
+        # Be respectful to RSS feeds: one connection per host at a time, so feeds
+        # sharing a domain are fetched in turn while different hosts run in parallel
+        connector = aiohttp.TCPConnector(limit_per_host=1)
+        
+        try:
+            async with aiohttp.ClientSession(connector=connector, headers=_REQUEST_HEADERS) as session:
+                print("Starting HVAC Newsletter Generation...")
+        
+                # 1. Fetch articles
+                print("Fetching articles from RSS feeds...")
+                articles = await self.fetch_all_articles_async(session)
+                print(f"Fetched {len(articles)} new unique articles")
+        
+                if not articles:
+                    print("No new articles found. Exiting.")
+                    self.save_processed_articles(set())
+                    self.save_feed_state()
+                    return
+        
+                # 2. Rank and select top articles
+                print("Ranking articles...")
+                ranked_articles = self.rank_articles(articles)
+        
+                # 3. Generate newsletter
+                print("Generating newsletter content...")
+                newsletter_html = self.generate_newsletter_html(ranked_articles)
+        
+                # 4. Send to Mailchimp
+                subject = f"HVAC Daily Brief - {datetime.now().strftime('%B %d, %Y')}"
+                success = await self.send_to_mailchimp(session, subject, newsletter_html)
+        
+                if success:
+                    # 5. Save processed article hashes and feed caching state
+                    new_hashes = {article.content_hash for article in articles}
+                    self.save_processed_articles(new_hashes)
+                    self.save_feed_state()
+                    print("Newsletter generation completed successfully!")
+                else:
+                    print("Newsletter generation failed.")
+        finally:
+            # Release the parser threads however the run ends
+            self._parse_pool.shutdown()
 
 if __name__ == "__main__":
     generator = HVACNewsletterGenerator()
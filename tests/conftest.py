@@ -0,0 +1,17 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, 'src'))
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+@pytest.fixture
+def read_fixture():
+    """Return a function reading a feed fixture's raw bytes by file name"""
+    def read(name: str) -> bytes:
+        with open(os.path.join(FIXTURES, name), 'rb') as f:
+            return f.read()
+    return read
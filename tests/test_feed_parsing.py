@@ -0,0 +1,90 @@
+"""Compare the streaming ElementTree feed parser with feedparser"""
+
+import xml.etree.ElementTree as ElementTree
+from io import BytesIO
+
+import feedparser
+import pytest
+
+from newsletter_generator import HVACNewsletterGenerator, _parse_feed_entries
+
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+    # Keep the generator away from the repo's data/ directory
+    monkeypatch.chdir(tmp_path)
+    return HVACNewsletterGenerator()
+
+
+def extract(generator, entries):
+    return generator.extract_articles(entries, 'Test Source', set(), set())
+
+
+@pytest.mark.parametrize('fixture', [
+    'rss2.xml', 'atom.xml', 'media_rss.xml', 'rss_guid.xml', 'rss090.xml',
+])
+def test_articles_match_feedparser(generator, fixture, read_fixture):
+    body = read_fixture(fixture)
+    
+    ours = extract(generator, _parse_feed_entries(body))
+    reference = extract(generator, feedparser.parse(body).entries)
+    
+    assert len(ours) == len(reference) > 0
+    for article, expected in zip(ours, reference):
+        assert article.title == expected.title
+        assert article.url == expected.url
+        assert article.published == expected.published
+        assert article.summary == expected.summary
+        assert article.content_hash == expected.content_hash
+
+
+def test_extension_elements_do_not_override_core_fields(read_fixture):
+    entry = _parse_feed_entries(read_fixture('media_rss.xml'))[0]
+    
+    assert entry['title'] == 'Real title'
+    assert entry['summary'] == 'Real description about geothermal systems.'
+
+
+def test_summary_falls_back_to_full_content(read_fixture):
+    rss_entries = _parse_feed_entries(read_fixture('rss2.xml'))
+    atom_entries = _parse_feed_entries(read_fixture('atom.xml'))
+    
+    assert 'refrigerant regulations' in rss_entries[1]['summary']
+    assert 'replacing ageing chillers' in atom_entries[1]['summary']
+
+
+def test_description_preferred_over_content_encoded(read_fixture):
+    entry = _parse_feed_entries(read_fixture('rss2.xml'))[0]
+    
+    assert 'Full article body' not in entry['summary']
+
+
+def test_xhtml_summary_keeps_text(read_fixture):
+    entry = _parse_feed_entries(read_fixture('atom.xml'))[0]
+    
+    assert entry['summary'] == 'Connected thermostats cut energy use in offices.'
+
+
+def test_script_and_style_bodies_are_dropped(generator, read_fixture):
+    article = extract(generator, _parse_feed_entries(read_fixture('rss2.xml')))[0]
+    
+    assert 'alert(1)' not in article.summary
+    assert 'color: blue' not in article.summary
+
+
+def test_entry_limit(read_fixture):
+    assert len(_parse_feed_entries(read_fixture('rss2.xml'), limit=2)) == 2
+
+
+def test_hash_stable_across_feedparser_fallback(generator, read_fixture):
+    body = read_fixture('rss2.xml')
+    # An HTML entity that is not defined in XML forces the feedparser fallback
+    malformed = body.replace(b'<title>HVAC Test Feed</title>', b'<title>HVAC&nbsp;Test Feed</title>')
+    
+    with pytest.raises(ElementTree.ParseError):
+        list(ElementTree.iterparse(BytesIO(malformed)))
+    
+    well_formed = extract(generator, _parse_feed_entries(body))
+    fallback = extract(generator, _parse_feed_entries(malformed))
+    
+    assert [a.content_hash for a in fallback] == [a.content_hash for a in well_formed]
@@ -0,0 +1,69 @@
+"""Processed-article hash storage, legacy SHA-256 compatibility and retention"""
+
+import hashlib
+import json
+import os
+
+import pytest
+
+from newsletter_generator import HVACNewsletterGenerator, _feedparser_entries
+
+
+def write_processed(data):
+    os.makedirs('data', exist_ok=True)
+    with open('data/processed_articles.json', 'w') as f:
+        json.dump(data, f)
+
+
+@pytest.fixture(autouse=True)
+def in_tmp_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+def test_legacy_sha256_hash_still_matches(read_fixture):
+    entries = _feedparser_entries(read_fixture('rss2.xml'))
+    first = entries[0]
+    combined = f"{first['title'].lower().strip()}{first['summary'].lower().strip()}"
+    legacy_hash = hashlib.sha256(combined.encode()).hexdigest()
+    write_processed({'processed_hashes': [legacy_hash]})
+    
+    generator = HVACNewsletterGenerator()
+    assert generator.has_legacy_hashes
+    
+    articles = generator.extract_articles(entries, 'Test Source', set(), set())
+    
+    assert [article.url for article in articles] == [entry['link'] for entry in entries[1:]]
+    # The article is now also known under its BLAKE2b hash
+    new_hashes = [content_hash for content_hash in generator.processed_articles if content_hash != legacy_hash]
+    assert len(new_hashes) == 1 and len(new_hashes[0]) == 32
+
+
+def test_no_legacy_check_without_legacy_hashes():
+    write_processed({'entries': [['0' * 32, 0]]})
+    
+    assert not HVACNewsletterGenerator().has_legacy_hashes
+
+
+def test_retention_restarts_for_articles_still_in_a_feed():
+    write_processed({'entries': [['a' * 32, 0], ['b' * 32, 0]]})
+    
+    generator = HVACNewsletterGenerator()
+    generator.current_hashes = {'a' * 32}
+    generator.save_processed_articles({'c' * 32})
+    
+    reloaded = HVACNewsletterGenerator().processed_articles
+    assert set(reloaded) == {'a' * 32, 'c' * 32}
+    assert reloaded['a' * 32] > 0
+
+
+def test_extract_articles_records_every_entry_hash(read_fixture):
+    generator = HVACNewsletterGenerator()
+    entries = _feedparser_entries(read_fixture('rss2.xml'))
+    feed_hashes = set()
+    
+    articles = generator.extract_articles(entries, 'Test Source', set(), feed_hashes)
+    generator.processed_articles = dict.fromkeys(feed_hashes, 0)
+    again = set()
+    
+    assert generator.extract_articles(entries, 'Test Source', set(), again) == []
+    assert again == feed_hashes == {article.content_hash for article in articles}